@@ -10,7 +10,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Callable, Type
+from typing import Any, Callable
 
 
 @dataclass
@@ -25,7 +25,10 @@ class Option:
     def __repr__(self):
         return f"Option(method={self.method.__name__}, opt_index={self.opt_index}, opt_data={self.opt_data})"
 
-    method: Type[Callable]
+    def __call__(self) -> None:
+        self.method(opt_index=self.opt_index, opt_data=self.opt_data)
+
+    method: Callable[..., None]
     opt_index: str = ""
     opt_data: Any = None
 
@@ -8,20 +8,12 @@
 # ======================================================================= #
 from __future__ import annotations
 
-import textwrap
+import sys
 from typing import Type
 
 from components.klipper import KLIPPER_DIR
 from components.klipper.klipper import Klipper
 from components.klipper.klipper_utils import install_input_shaper_deps
-from components.klipper_firmware.menus.klipper_build_menu import (
-    KlipperBuildFirmwareMenu,
-    KlipperKConfigMenu,
-)
-from components.klipper_firmware.menus.klipper_flash_menu import (
-    KlipperFlashMethodMenu,
-    KlipperSelectMcuConnectionMenu,
-)
 from components.moonraker import MOONRAKER_DIR
 from components.moonraker.moonraker import Moonraker
 from core.menus import Option
@@ -34,6 +26,19 @@ from utils.git_utils import rollback_repository
 # noinspection PyUnusedLocal
 # noinspection PyMethodMayBeStatic
 class AdvancedMenu(BaseMenu):
+    _MENU_STR: str = (
+        "╟───────────────────────────┬───────────────────────────╢\n"
+        "║ Klipper Firmware:         │ Repository Rollback:      ║\n"
+        "║  1) [Build]               │  6) [Klipper]             ║\n"
+        "║  2) [Flash]               │  7) [Moonraker]           ║\n"
+        "║  3) [Build + Flash]       │                           ║\n"
+        "║  4) [Get MCU ID]          │ System:                   ║\n"
+        "║                           │  8) [Change hostname]     ║\n"
+        "║ Extra Dependencies:       │                           ║\n"
+        "║  5) [Input Shaper]        │                           ║\n"
+        "╟───────────────────────────┴───────────────────────────╢\n"
+    )
+
     def __init__(self, previous_menu: Type[BaseMenu] | None = None) -> None:
         super().__init__()
         self.title = "Advanced Menu"
@@ -58,21 +63,7 @@ class AdvancedMenu(BaseMenu):
         }
 
     def print_menu(self) -> None:
-        menu = textwrap.dedent(
-            """
-            ╟───────────────────────────┬───────────────────────────╢
-            ║ Klipper Firmware:         │ Repository Rollback:      ║
-            ║  1) [Build]               │  6) [Klipper]             ║
-            ║  2) [Flash]               │  7) [Moonraker]           ║
-            ║  3) [Build + Flash]       │                           ║
-            ║  4) [Get MCU ID]          │ System:                   ║
-            ║                           │  8) [Change hostname]     ║
-            ║ Extra Dependencies:       │                           ║
-            ║  5) [Input Shaper]        │                           ║
-            ╟───────────────────────────┴───────────────────────────╢
-            """
-        )[1:]
-        print(menu, end="")
+        sys.stdout.write(self._MENU_STR)
 
     def klipper_rollback(self, **kwargs) -> None:
         rollback_repository(KLIPPER_DIR, Klipper)
@@ -81,19 +72,43 @@ class AdvancedMenu(BaseMenu):
         rollback_repository(MOONRAKER_DIR, Moonraker)
 
     def build(self, **kwargs) -> None:
+        from components.klipper_firmware.menus.klipper_build_menu import (
+            KlipperBuildFirmwareMenu,
+            KlipperKConfigMenu,
+        )
+
         KlipperKConfigMenu().run()
         KlipperBuildFirmwareMenu(previous_menu=self.__class__).run()
 
     def flash(self, **kwargs) -> None:
+        from components.klipper_firmware.menus.klipper_build_menu import (
+            KlipperKConfigMenu,
+        )
+        from components.klipper_firmware.menus.klipper_flash_menu import (
+            KlipperFlashMethodMenu,
+        )
+
         KlipperKConfigMenu().run()
         KlipperFlashMethodMenu(previous_menu=self.__class__).run()
 
     def build_flash(self, **kwargs) -> None:
+        from components.klipper_firmware.menus.klipper_build_menu import (
+            KlipperBuildFirmwareMenu,
+            KlipperKConfigMenu,
+        )
+        from components.klipper_firmware.menus.klipper_flash_menu import (
+            KlipperFlashMethodMenu,
+        )
+
         KlipperKConfigMenu().run()
         KlipperBuildFirmwareMenu(previous_menu=KlipperFlashMethodMenu).run()
         KlipperFlashMethodMenu(previous_menu=self.__class__).run()
 
     def get_id(self, **kwargs) -> None:
+        from components.klipper_firmware.menus.klipper_flash_menu import (
+            KlipperSelectMcuConnectionMenu,
+        )
+
         KlipperSelectMcuConnectionMenu(
             previous_menu=self.__class__,
             standalone=True,
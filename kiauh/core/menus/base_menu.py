@@ -9,9 +9,9 @@
 
 from __future__ import annotations
 
+import os
 import subprocess
 import sys
-import textwrap
 import traceback
 from abc import abstractmethod
 from enum import Enum
@@ -25,71 +25,89 @@ from core.types.color import Color
 from utils.input_utils import get_selection_input
 
 
+def _write_bytes(data: bytes) -> None:
+    # flush pending text output first, so both channels stay in order
+    sys.stdout.flush()
+    try:
+        fd = sys.stdout.fileno()
+    except (AttributeError, OSError):
+        # stdout is not backed by a file descriptor (e.g. redirected to a buffer)
+        sys.stdout.write(data.decode("utf-8"))
+        return
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
+_CLEAR_SEQ: bytes | None = None
+
+
+def _get_clear_seq() -> bytes:
+    global _CLEAR_SEQ
+    if _CLEAR_SEQ is None:
+        try:
+            # let terminfo resolve the sequence for the current TERM once
+            _CLEAR_SEQ = subprocess.check_output(
+                ["clear", "-x"], stderr=subprocess.DEVNULL
+            )
+        except (OSError, subprocess.CalledProcessError):
+            # home the cursor and erase the screen, keep scrollback
+            _CLEAR_SEQ = b"\x1b[H\x1b[2J"
+    return _CLEAR_SEQ
+
+
 def clear() -> None:
-    subprocess.call("clear -x", shell=True)
+    _write_bytes(_get_clear_seq())
 
 
-def print_header() -> None:
+def _build_header() -> str:
     line1 = " [ KIAUH ] "
     line2 = "Klipper Installation And Update Helper"
     line3 = ""
     color = Color.CYAN
     count = 62 - len(str(color)) - len(str(Color.RST))
-    header = textwrap.dedent(
-        f"""
-        ╔═══════════════════════════════════════════════════════╗
-        ║ {Color.apply(f"{line1:~^{count}}", color)} ║
-        ║ {Color.apply(f"{line2:^{count}}", color)} ║
-        ║ {Color.apply(f"{line3:~^{count}}", color)} ║
-        ╚═══════════════════════════════════════════════════════╝
-        """
-    )[1:]
-    print(header, end="")
-
-
-def print_quit_footer() -> None:
-    text = "Q) Quit"
-    color = Color.RED
-    count = 62 - len(str(color)) - len(str(Color.RST))
-    footer = textwrap.dedent(
-        f"""
-        ║ {color}{text:^{count}}{Color.RST} ║
-        ╚═══════════════════════════════════════════════════════╝
-        """
-    )[1:]
-    print(footer, end="")
+    return (
+        "╔═══════════════════════════════════════════════════════╗\n"
+        f"║ {Color.apply(f'{line1:~^{count}}', color)} ║\n"
+        f"║ {Color.apply(f'{line2:^{count}}', color)} ║\n"
+        f"║ {Color.apply(f'{line3:~^{count}}', color)} ║\n"
+        "╚═══════════════════════════════════════════════════════╝\n"
+    )
+
+
+_FOOTER_TPL: str = (
+    "║ {color}{text:^{count}}{reset} ║\n"
+    "╚═══════════════════════════════════════════════════════╝\n"
+)
+
+
+def _footer_fields(text: str, color: Color) -> Dict[str, str | int]:
+    return {
+        "color": str(color),
+        "text": text,
+        "count": 62 - len(str(color)) - len(str(Color.RST)),
+        "reset": str(Color.RST),
+    }
+
+
+# all of these only depend on constants, so they are rendered once at import time
+_HEADER_STR: str = _build_header()
+_QUIT_FIELDS = _footer_fields("Q) Quit", Color.RED)
+_BACK_FIELDS = _footer_fields("B) « Back", Color.GREEN)
+_QUIT_FOOTER: str = _FOOTER_TPL.format_map(_QUIT_FIELDS)
+_BACK_FOOTER: str = _FOOTER_TPL.format_map(_BACK_FIELDS)
+_BACK_HELP_COUNT = 34 - len(str(Color.GREEN)) - len(str(Color.RST))
+_BACK_HELP_BACK = Color.apply(f"{'B) « Back':^{_BACK_HELP_COUNT}}", Color.GREEN)
+_BACK_HELP_HELP = Color.apply(f"{'H) Help [?]':^{_BACK_HELP_COUNT}}", Color.YELLOW)
+_BACK_HELP_BODY_LINE: str = f"║ {_BACK_HELP_BACK} │ {_BACK_HELP_HELP} ║\n"
+_BACK_HELP_FOOTER: str = (
+    _BACK_HELP_BODY_LINE + "╚═══════════════════════════╧═══════════════════════════╝\n"
+)
+_BLANK_FOOTER: str = "╚═══════════════════════════════════════════════════════╝\n"
 
 
 def print_back_footer() -> None:
-    text = "B) « Back"
-    color = Color.GREEN
-    count = 62 - len(str(color)) - len(str(Color.RST))
-    footer = textwrap.dedent(
-        f"""
-        ║ {color}{text:^{count}}{Color.RST} ║
-        ╚═══════════════════════════════════════════════════════╝
-        """
-    )[1:]
-    print(footer, end="")
-
-
-def print_back_help_footer() -> None:
-    text1 = "B) « Back"
-    text2 = "H) Help [?]"
-    color1 = Color.GREEN
-    color2 = Color.YELLOW
-    count = 34 - len(str(color1)) - len(str(Color.RST))
-    footer = textwrap.dedent(
-        f"""
-        ║ {color1}{text1:^{count}}{Color.RST} │ {color2}{text2:^{count}}{Color.RST} ║
-        ╚═══════════════════════════╧═══════════════════════════╝
-        """
-    )[1:]
-    print(footer, end="")
-
-
-def print_blank_footer() -> None:
-    print("╚═══════════════════════════════════════════════════════╝")
+    sys.stdout.write(_BACK_FOOTER)
 
 
 class MenuTitleStyle(Enum):
@@ -124,6 +142,13 @@ class BaseMenu(metaclass=PostInitCaller):
     help_menu: Type[BaseMenu] | None = None
     footer_type: FooterType = FooterType.BACK
 
+    _FOOTERS: Dict[FooterType, str] = {
+        FooterType.QUIT: _QUIT_FOOTER,
+        FooterType.BACK: _BACK_FOOTER,
+        FooterType.BACK_HELP: _BACK_HELP_FOOTER,
+        FooterType.BLANK: _BLANK_FOOTER,
+    }
+
     message_service = MessageService()
 
     def __init__(self, **kwargs) -> None:
@@ -134,6 +159,11 @@ class BaseMenu(metaclass=PostInitCaller):
         self.set_previous_menu(self.previous_menu)
         self.set_options()
 
+        # header, title and footer are static for the lifetime of a menu instance
+        header = _HEADER_STR if self.header else ""
+        self._head_bytes = (header + self.__get_menu_title()).encode("utf-8")
+        self._footer_bytes = self.__get_footer().encode("utf-8")
+
         # conditionally add options based on footer type
         if self.footer_type is FooterType.QUIT:
             self.options["q"] = Option(method=self.__exit)
@@ -180,7 +210,7 @@ class BaseMenu(metaclass=PostInitCaller):
             self.spinner.stop()
             self.spinner = None
 
-    def __print_menu_title(self) -> None:
+    def __get_menu_title(self) -> str:
         count = 62 - len(str(self.title_color)) - len(str(Color.RST))
         menu_title = "╔═══════════════════════════════════════════════════════╗\n"
         if self.title:
@@ -195,41 +225,29 @@ class BaseMenu(metaclass=PostInitCaller):
                 else f"{title:^{count}}"
             )
             menu_title += f"║ {Color.apply(line, self.title_color)} ║\n"
-        print(menu_title, end="")
+        return menu_title
 
-    def __print_footer(self) -> None:
-        if self.footer_type is FooterType.QUIT:
-            print_quit_footer()
-        elif self.footer_type is FooterType.BACK:
-            print_back_footer()
-        elif self.footer_type is FooterType.BACK_HELP:
-            print_back_help_footer()
-        elif self.footer_type is FooterType.BLANK:
-            print_blank_footer()
-        else:
-            raise NotImplementedError("FooterType not correctly implemented!")
+    def __get_footer(self) -> str:
+        try:
+            return self._FOOTERS[self.footer_type]
+        except KeyError:
+            raise NotImplementedError("FooterType not correctly implemented!") from None
 
     def __display_menu(self) -> None:
         self.message_service.display_message()
 
-        if self.header:
-            print_header()
-
-        self.__print_menu_title()
+        _write_bytes(self._head_bytes)
         self.print_menu()
-        self.__print_footer()
+        _write_bytes(self._footer_bytes)
 
     def run(self) -> None:
         """Start the menu lifecycle. When this function returns, the lifecycle of the menu ends."""
         try:
             self.__display_menu()
+            # invalid input is rejected inside get_selection_input with a single
+            # error line, so the menu is only redrawn after a valid option ran
             option = get_selection_input(self.input_label_txt, self.options)
-            selected_option: Option = self.options.get(option)
-
-            selected_option.method(
-                opt_index=selected_option.opt_index,
-                opt_data=selected_option.opt_data,
-            )
+            self.options[option]()
 
             self.run()
 
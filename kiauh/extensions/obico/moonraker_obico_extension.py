@@ -72,10 +72,10 @@ class ObicoExtension(BaseExtension):
             self._print_is_already_installed()
             options = ["l", "r", "b"]
             action = get_selection_input("Perform action", option_list=options)
-            if action.lower() == "b":
+            if action == "b":
                 Logger.print_info("Exiting Obico for Klipper installation ...")
                 return
-            elif action.lower() == "l":
+            elif action == "l":
                 unlinked_instances: List[MoonrakerObico] = [
                     obico for obico in obico_instances if not obico.is_linked
                 ]
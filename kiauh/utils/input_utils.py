@@ -9,12 +9,16 @@
 from __future__ import annotations
 
 import re
-from typing import Dict, List
+from typing import AbstractSet, Dict, List
 
 from core.constants import INVALID_CHOICE
 from core.logger import Logger
 from core.types.color import Color
 
+OPTIONS_CONFIRM = frozenset({"y", "yes"})
+OPTIONS_DECLINE = frozenset({"n", "no"})
+OPTIONS_GO_BACK = frozenset({"b", "B"})
+
 
 def get_confirm(question: str, default_choice=True, allow_go_back=False) -> bool | None:
     """
@@ -24,27 +28,25 @@ def get_confirm(question: str, default_choice=True, allow_go_back=False) -> bool
     :param allow_go_back: Navigate back to a previous dialog
     :return: Either True or False, or None on go_back
     """
-    options_confirm = ["y", "yes"]
-    options_decline = ["n", "no"]
-    options_go_back = ["b", "B"]
+    options_confirm = OPTIONS_CONFIRM
+    options_decline = OPTIONS_DECLINE
 
     if default_choice:
         def_choice = "(Y/n)"
-        options_confirm.append("")
+        options_confirm = options_confirm | {""}
     else:
         def_choice = "(y/N)"
-        options_decline.append("")
+        options_decline = options_decline | {""}
 
+    _question = format_question(question + f" {def_choice}", None)
     while True:
-        choice = (
-            input(format_question(question + f" {def_choice}", None)).strip().lower()
-        )
+        choice = input(_question).strip().lower()
 
         if choice in options_confirm:
             return True
         elif choice in options_decline:
             return False
-        elif allow_go_back and choice in options_go_back:
+        elif allow_go_back and choice in OPTIONS_GO_BACK:
             return None
         else:
             Logger.print_error(INVALID_CHOICE)
@@ -66,11 +68,10 @@ def get_number_input(
     :param allow_go_back: Navigate back to a previous dialog
     :return: Either the validated number input, or None on go_back
     """
-    options_go_back = ["b", "B"]
     _question = format_question(question, default)
     while True:
         _input = input(_question)
-        if allow_go_back and _input in options_go_back:
+        if allow_go_back and _input in OPTIONS_GO_BACK:
             return None
 
         if _input == "" and default is not None:
@@ -100,7 +101,7 @@ def get_string_input(
     :param default: Optional default value
     :return: The validated string value
     """
-    _exclude = [] if exclude is None else exclude
+    _exclude = frozenset() if exclude is None else frozenset(exclude)
     _question = format_question(question, default)
     _pattern = re.compile(regex) if regex is not None else None
     while True:
@@ -124,23 +125,27 @@ def get_string_input(
 
 def get_selection_input(question: str, option_list: List | Dict, default=None) -> str:
     """
-    Helper method to get a selection from a list of options from the user
+    Helper method to get a selection from a list of options from the user.
+    Invalid input only prints an error line and prompts again, nothing is redrawn.
     :param question: The question to display
     :param option_list: The list of options the user can select from
     :param default: Optional default value
-    :return: The option that was selected by the user
+    :return: The option that was selected by the user, already lowercased
     """
+    _options: AbstractSet[str]
+    if isinstance(option_list, list):
+        _options = set(option_list)
+    elif isinstance(option_list, dict):
+        _options = option_list.keys()
+    else:
+        raise ValueError("Invalid option_list type")
+
+    _question = format_question(question, default)
     while True:
-        _input = input(format_question(question, default)).strip().lower()
-
-        if isinstance(option_list, list):
-            if _input in option_list:
-                return _input
-        elif isinstance(option_list, dict):
-            if _input in option_list.keys():
-                return _input
-        else:
-            raise ValueError("Invalid option_list type")
+        _input = input(_question).strip().lower()
+
+        if _input in _options:
+            return _input
 
         Logger.print_error("Invalid option! Please select a valid option.", False)
 